@@ -0,0 +1,24 @@
+# Generated by Django 5.0.2 on 2026-08-31 10:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_alter_order_status'),
+        ('users', '0004_bankaccount_users_banka_user_id_ee6ec2_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['delivery_pincode', 'status'], name='api_order_deliver_3b07be_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tiffin',
+            index=models.Index(fields=['is_available'], name='api_tiffin_is_avai_2ea265_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations
+
+# Expression GIN index matching the SearchVector('name', 'description',
+# config='english') annotation used by the tiffin search endpoint. Created
+# with raw SQL and guarded by vendor because GIN/tsvector are
+# Postgres-only; the SQLite test database simply skips it.
+
+CREATE_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS api_tiffin_search_gin ON api_tiffin "
+    "USING GIN (to_tsvector('english', COALESCE(name, '') || ' ' || COALESCE(description, '')))"
+)
+
+DROP_INDEX_SQL = "DROP INDEX IF EXISTS api_tiffin_search_gin"
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(CREATE_INDEX_SQL)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_INDEX_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_order_api_order_deliver_3b07be_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
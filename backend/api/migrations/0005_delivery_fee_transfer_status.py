@@ -0,0 +1,18 @@
+# Generated by Django 5.0.2 on 2026-08-31 10:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_tiffin_search_gin_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='delivery',
+            name='fee_transfer_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('paid', 'Paid'), ('failed', 'Failed')], default='pending', max_length=20),
+        ),
+    ]
@@ -10,7 +10,13 @@ class Tiffin(models.Model):
     image = models.ImageField(upload_to='tiffins/', blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    class Meta:
+        indexes = [
+            # Public browse pages always filter on availability.
+            models.Index(fields=['is_available']),
+        ]
+
     def __str__(self):
         return f"{self.name} - {self.owner.business_name}"
 
@@ -35,7 +41,13 @@ class Order(models.Model):
     delivery_pincode = models.CharField(max_length=6)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    class Meta:
+        indexes = [
+            # The delivery-boy feed filters on pincode plus status.
+            models.Index(fields=['delivery_pincode', 'status']),
+        ]
+
     def __str__(self):
         return f"Order #{self.id} - {self.customer.username}"
     
@@ -53,11 +65,20 @@ class Delivery(models.Model):
         ('cancelled', 'Cancelled'),
     )
     
+    FEE_TRANSFER_CHOICES = (
+        ('pending', 'Pending'),
+        ('paid', 'Paid'),
+        ('failed', 'Failed'),
+    )
+
     order = models.OneToOneField(Order, on_delete=models.CASCADE, related_name='delivery')
     delivery_boy = models.ForeignKey(DeliveryBoy, on_delete=models.SET_NULL, null=True, related_name='deliveries')
     pickup_address = models.TextField()
     delivery_address = models.TextField()
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    # Outcome of the post-accept delivery-fee transfer; 'failed' rows are
+    # the reconciliation queue for fees that could not be collected.
+    fee_transfer_status = models.CharField(max_length=20, choices=FEE_TRANSFER_CHOICES, default='pending')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -1,4 +1,4 @@
-import re
+import copy
 from django.db import IntegrityError
 
 from rest_framework import serializers
@@ -7,6 +7,25 @@ from rest_framework.exceptions import ValidationError
 from users.models import User, TiffinOwner, DeliveryBoy, Wallet, WalletTransaction, BankAccount
 from .models import Tiffin, Order, Delivery
 
+
+class CachedFieldsMixin:
+    """Memoize ModelSerializer field introspection at the class level.
+
+    DRF rebuilds the field map (model introspection included) every time a
+    serializer is instantiated, which happens per request and per nested
+    row. Build it once per class and hand out deep copies, so instances
+    still get their own unbound field objects.
+    """
+
+    _fields_cache = None
+
+    def get_fields(self):
+        cls = type(self)
+        if cls._fields_cache is None:
+            cls._fields_cache = super().get_fields()
+        return copy.deepcopy(cls._fields_cache)
+
+
 class UserSerializer(serializers.ModelSerializer):
     business_name = serializers.CharField(write_only=True, required=False)
     business_address = serializers.CharField(write_only=True, required=False)
@@ -35,26 +54,39 @@ class UserSerializer(serializers.ModelSerializer):
         ]
 
     def get_tiffin_owner(self, obj):
-        if hasattr(obj, 'tiffin_owner'):
+        # getattr resolves from the select_related cache when the viewset
+        # joined the relation, instead of hasattr's probe-per-user query.
+        tiffin_owner = getattr(obj, 'tiffin_owner', None)
+        if tiffin_owner is not None:
             return {
-                'business_name': obj.tiffin_owner.business_name,
-                'business_address': obj.tiffin_owner.business_address,
-                'business_pincode': obj.tiffin_owner.business_pincode,
-                'is_verified': obj.tiffin_owner.is_verified
+                'business_name': tiffin_owner.business_name,
+                'business_address': tiffin_owner.business_address,
+                'business_pincode': tiffin_owner.business_pincode,
+                'is_verified': tiffin_owner.is_verified
             }
         return None
 
     def get_delivery_boy(self, obj):
-        if hasattr(obj, 'delivery_boy'):
+        delivery_boy = getattr(obj, 'delivery_boy', None)
+        if delivery_boy is not None:
             return {
-                'vehicle_number': obj.delivery_boy.vehicle_number,
-                'is_available': obj.delivery_boy.is_available
+                'vehicle_number': delivery_boy.vehicle_number,
+                'is_available': delivery_boy.is_available
             }
         return None
 
     def validate_password(self, value):
-        password_policy = re.compile(r'^(?=.*[A-Z])(?=.*\d)(?=.*[^A-Za-z0-9]).{8,}$')
-        if not password_policy.match(value):
+        # One pass over the password, classifying each character, instead
+        # of a regex with three lookaheads that each rescan the string.
+        has_upper = has_digit = has_special = False
+        for ch in value:
+            if 'A' <= ch <= 'Z':
+                has_upper = True
+            elif ch.isdigit():
+                has_digit = True
+            elif not ('a' <= ch <= 'z'):
+                has_special = True
+        if len(value) < 8 or not (has_upper and has_digit and has_special):
             raise serializers.ValidationError(
                 'Password must be at least 8 characters long and include one uppercase letter, '
                 'one number, and one special character.'
@@ -137,7 +169,7 @@ class TiffinSerializer(serializers.ModelSerializer):
         model = Tiffin
         fields = ('id', 'owner', 'owner_name', 'name', 'description', 'price', 'is_available', 'image', 'created_at', 'updated_at')
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     customer_name = serializers.CharField(source='customer.username', read_only=True)
     tiffin_name = serializers.CharField(source='tiffin.name', read_only=True)
     delivery_boy_name = serializers.CharField(source='delivery_boy.user.username', read_only=True)
@@ -150,7 +182,7 @@ class OrderSerializer(serializers.ModelSerializer):
                  'delivery_boy_name', 'quantity', 'total_price', 'status', 'delivery_address', 
                  'delivery_pincode', 'created_at', 'updated_at')
 
-class DeliverySerializer(serializers.ModelSerializer):
+class DeliverySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     order_details = OrderSerializer(source='order', read_only=True)
     delivery_boy_name = serializers.CharField(source='delivery_boy.user.username', read_only=True)
 
@@ -168,9 +200,10 @@ class BankAccountSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         user = self.context['request'].user
-        # If this is set as primary, unset others
+        # If this is set as primary, unset others; filtering on is_primary
+        # keeps the UPDATE from rewriting rows that are already False.
         if validated_data.get('is_primary', True):
-            BankAccount.objects.filter(user=user).update(is_primary=False)
+            BankAccount.objects.filter(user=user, is_primary=True).update(is_primary=False)
         return BankAccount.objects.create(user=user, **validated_data)
 
 
@@ -182,9 +215,20 @@ class WalletTransactionSerializer(serializers.ModelSerializer):
 
 
 class WalletSerializer(serializers.ModelSerializer):
-    transactions = WalletTransactionSerializer(many=True, read_only=True)
+    # Cap the embedded history so wallet responses stay bounded as
+    # transactions accumulate.
+    RECENT_TRANSACTION_LIMIT = 50
+
+    # Declared explicitly: balance is a property over the integer
+    # balance_paise column, not a model field.
+    balance = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+    transactions = serializers.SerializerMethodField()
 
     class Meta:
         model = Wallet
         fields = ('balance', 'updated_at', 'transactions')
-        read_only_fields = ('balance', 'updated_at', 'transactions')
\ No newline at end of file
+        read_only_fields = ('balance', 'updated_at', 'transactions')
+
+    def get_transactions(self, obj):
+        txns = obj.transactions.order_by('-created_at')[:self.RECENT_TRANSACTION_LIMIT]
+        return WalletTransactionSerializer(txns, many=True).data
\ No newline at end of file
@@ -1,4 +1,5 @@
-from decimal import Decimal
+import logging
+from decimal import Decimal, InvalidOperation
 
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
@@ -12,7 +13,9 @@ from .serializers import (
     WalletSerializer, WalletTransactionSerializer, BankAccountSerializer
 )
 from rest_framework.permissions import AllowAny
-from django.db import models, transaction
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.core.cache import cache
+from django.db import IntegrityError, connection, models, transaction
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from django.utils import timezone
 import random
@@ -22,6 +25,8 @@ from django.http import JsonResponse
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 
+logger = logging.getLogger(__name__)
+
 class IsOwnerOrReadOnly(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.method in permissions.SAFE_METHODS:
@@ -32,15 +37,72 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
 DELIVERY_FEE = Decimal('10.00')
 OWNER_ACCEPTANCE_STATUSES = {'confirmed', 'preparing', 'ready_for_delivery', 'picked_up', 'delivered'}
 
+# Valid status keys, frozen once instead of rebuilding dict(STATUS_CHOICES)
+# on every update_status request.
+_ORDER_STATUSES = frozenset(dict(Order.STATUS_CHOICES))
+_DELIVERY_STATUSES = frozenset(dict(Delivery.STATUS_CHOICES))
+
+
+def _parse_amount(value):
+    """Parse a client-supplied amount straight to Decimal, or None if invalid.
+
+    Going through float would reintroduce binary rounding into balance
+    arithmetic, which is all DecimalField-backed.
+    """
+    try:
+        amount = Decimal(str(value))
+    except (InvalidOperation, TypeError, ValueError):
+        return None
+    if not amount.is_finite():
+        return None
+    return amount
+
 
 def _get_wallet(user):
-    wallet, _ = Wallet.objects.get_or_create(user=user)
+    # Plain SELECT on the common path; get_or_create pays a savepoint
+    # round-trip on every call once the row exists. The user join plus
+    # only() keeps __str__/logging from lazy-loading the user row while
+    # fetching just the columns the wallet endpoints read.
+    wallet = (
+        Wallet.objects.select_related('user')
+        .only('balance_paise', 'updated_at', 'user__username')
+        .filter(user=user)
+        .first()
+    )
+    if wallet is None:
+        try:
+            # Savepoint only on the one-time creation path, so a lost
+            # creation race does not poison an enclosing transaction.
+            with transaction.atomic():
+                wallet = Wallet.objects.create(user=user)
+        except IntegrityError:
+            wallet = Wallet.objects.get(user=user)
     return wallet
 
 
+def _get_wallet_for_update(user):
+    # Ensure the row exists, then lock it for the rest of the enclosing
+    # transaction so the balance check and the debit see the same value.
+    wallet = _get_wallet(user)
+    return Wallet.objects.select_for_update().get(pk=wallet.pk)
+
+
+def _to_paise(amount):
+    return int((Decimal(amount) * 100).to_integral_value())
+
+
 def _adjust_wallet_balance(wallet, delta):
-    wallet.balance = (wallet.balance or Decimal('0')) + delta
-    wallet.save(update_fields=['balance', 'updated_at'])
+    # Single atomic UPDATE with an F() expression: no read-modify-write, so
+    # concurrent adjustments cannot lose each other's deltas, and the delta
+    # is pushed as plain integer paise. The atomic block keeps the refresh
+    # on the same transaction as the UPDATE, so the value handed back to
+    # callers is the one this delta produced.
+    with transaction.atomic():
+        Wallet.objects.filter(pk=wallet.pk).update(
+            balance_paise=models.F('balance_paise') + _to_paise(delta),
+            updated_at=timezone.now(),
+        )
+        wallet.refresh_from_db(fields=['balance_paise', 'updated_at'])
 
 
 def _record_wallet_transaction(wallet, txn_type, amount, reference=''):
@@ -54,7 +116,7 @@ def _credit_owner_for_order(order):
 
 
 def _transfer_delivery_fee(delivery):
-    owner_wallet = _get_wallet(delivery.order.tiffin.owner.user)
+    owner_wallet = _get_wallet_for_update(delivery.order.tiffin.owner.user)
     if owner_wallet.balance < DELIVERY_FEE:
         raise ValidationError({'wallet': 'Owner wallet has insufficient balance to pay delivery fee.'})
     _adjust_wallet_balance(owner_wallet, -DELIVERY_FEE)
@@ -64,6 +126,30 @@ def _transfer_delivery_fee(delivery):
     _adjust_wallet_balance(delivery_wallet, DELIVERY_FEE)
     _record_wallet_transaction(delivery_wallet, 'delivery_earning', DELIVERY_FEE, reference=f'DELIVERY:{delivery.id}')
 
+
+def _run_delivery_fee_transfer(delivery_id):
+    """Run the fee transfer in its own transaction, after accept commits.
+
+    Scheduled via transaction.on_commit so the four wallet statements no
+    longer sit inside the accept request's transaction; a task queue could
+    take this over later without changing the call site.
+    """
+    delivery = Delivery.objects.select_related(
+        'order__tiffin__owner__user', 'delivery_boy__user'
+    ).get(pk=delivery_id)
+    try:
+        with transaction.atomic():
+            _transfer_delivery_fee(delivery)
+            Delivery.objects.filter(pk=delivery_id).update(fee_transfer_status='paid')
+    except ValidationError:
+        # on_commit has no retry, so record the failure durably — failed
+        # rows are the reconciliation queue for uncollected fees.
+        Delivery.objects.filter(pk=delivery_id).update(fee_transfer_status='failed')
+        logger.warning(
+            'Delivery fee transfer failed for delivery %s: owner wallet has insufficient balance.',
+            delivery_id,
+        )
+
 class UserViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
@@ -75,20 +161,36 @@ class UserViewSet(viewsets.ModelViewSet):
         return super().get_permissions()
 
     def get_queryset(self):
+        # UserSerializer probes the tiffin_owner/delivery_boy reverse
+        # one-to-ones for every user; join them so the probes stay in memory.
+        queryset = User.objects.select_related('tiffin_owner', 'delivery_boy')
         if self.request.user.user_type == 'owner':
-            return User.objects.filter(id=self.request.user.id)
-        return User.objects.all()
+            return queryset.filter(id=self.request.user.id)
+        return queryset
+
+    # SPAs hit `me` on every navigation; a short TTL keeps the profile
+    # fresh while skipping serialization (and its relation probes) on hits.
+    ME_CACHE_TTL = 30
+
+    @staticmethod
+    def _me_cache_key(user_id):
+        return f'user:me:{user_id}'
 
     @action(detail=False, methods=['get'])
     def me(self, request):
-        serializer = self.get_serializer(request.user)
-        return Response(serializer.data)
+        key = self._me_cache_key(request.user.id)
+        data = cache.get(key)
+        if data is None:
+            data = self.get_serializer(request.user).data
+            cache.set(key, data, self.ME_CACHE_TTL)
+        return Response(data)
 
     @action(detail=False, methods=['patch', 'put'])
     def update_me(self, request):
         serializer = self.get_serializer(request.user, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
         serializer.save()
+        cache.delete(self._me_cache_key(request.user.id))
         return Response(serializer.data)
 
 
@@ -125,11 +227,22 @@ class TiffinViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
-        queryset = Tiffin.objects.all()
+        # Join the owner row up front: TiffinSerializer reads owner.business_name
+        # for every tiffin, which would otherwise cost one query per row.
+        queryset = Tiffin.objects.select_related('owner').all()
+
+        if self.action == 'list':
+            # Project only the columns the serializer reads; in particular
+            # this keeps the owner join from dragging in the whole
+            # TiffinOwner row when only business_name is needed.
+            queryset = queryset.only(
+                'name', 'description', 'price', 'is_available', 'image',
+                'created_at', 'updated_at', 'owner__business_name',
+            )
 
         if user.is_authenticated and user.user_type == 'owner':
             # Owners only see their own tiffins.
-            print(f"Filtering tiffins for owner: {user.username}")  # Debug log
+            logger.debug("Filtering tiffins for owner: %s", user.username)
             return queryset.filter(owner__user=user)
 
         # For anonymous users or non-owners, always filter by availability
@@ -143,9 +256,17 @@ class TiffinViewSet(viewsets.ModelViewSet):
         # Apply search filter if provided
         search_term = self.request.query_params.get('search', None)
         if search_term:
-            queryset = queryset.filter(
-                models.Q(name__icontains=search_term) | models.Q(description__icontains=search_term)
-            )
+            if connection.vendor == 'postgresql':
+                # Full-text search backed by the GIN index from migration
+                # 0004; the double icontains forced a sequential scan with
+                # two LIKE '%term%' predicates.
+                queryset = queryset.annotate(
+                    search=SearchVector('name', 'description', config='english')
+                ).filter(search=SearchQuery(search_term, config='english'))
+            else:
+                queryset = queryset.filter(
+                    models.Q(name__icontains=search_term) | models.Q(description__icontains=search_term)
+                )
 
         return queryset
 
@@ -170,8 +291,26 @@ class OrderViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
-        queryset = Order.objects.all()
-        
+        # OrderSerializer walks customer.username, tiffin.name and
+        # delivery_boy.user.username per row, and update_status needs the
+        # tiffin owner — join them all here instead of one query each.
+        queryset = Order.objects.select_related(
+            'customer', 'tiffin', 'tiffin__owner', 'tiffin__owner__user', 'delivery_boy__user'
+        )
+
+        if self.action == 'list':
+            # Listing never touches the tiffin owner, so drop that join and
+            # project only what the serializer reads — the joined User rows
+            # otherwise contribute their address TextFields per order.
+            queryset = Order.objects.select_related(
+                'customer', 'tiffin', 'delivery_boy__user'
+            ).only(
+                'quantity', 'total_price', 'status', 'delivery_address',
+                'delivery_pincode', 'created_at', 'updated_at',
+                'customer__username', 'tiffin__name',
+                'delivery_boy__user__username',
+            )
+
         if user.user_type == 'customer':
             return queryset.filter(customer=user)
         elif user.user_type == 'owner':
@@ -195,11 +334,13 @@ class OrderViewSet(viewsets.ModelViewSet):
         quantity = serializer.validated_data['quantity']
         total_price = tiffin.price * quantity
 
-        customer_wallet = _get_wallet(self.request.user)
-        if customer_wallet.balance < total_price:
-            raise ValidationError({'wallet': 'Insufficient wallet balance. Please add money to your wallet before placing an order.'})
-
         with transaction.atomic():
+            # Lock the wallet before checking the balance so concurrent
+            # orders cannot both pass the check and overdraw it.
+            customer_wallet = _get_wallet_for_update(self.request.user)
+            if customer_wallet.balance < total_price:
+                raise ValidationError({'wallet': 'Insufficient wallet balance. Please add money to your wallet before placing an order.'})
+
             order = serializer.save(customer=self.request.user, total_price=total_price)
             _adjust_wallet_balance(customer_wallet, -total_price)
             _record_wallet_transaction(customer_wallet, 'debit', total_price, reference=f'ORDER:{order.id}')
@@ -209,7 +350,7 @@ class OrderViewSet(viewsets.ModelViewSet):
         order = self.get_object()
         new_status = request.data.get('status')
         
-        if new_status not in dict(Order.STATUS_CHOICES):
+        if new_status not in _ORDER_STATUSES:
             return Response({'error': 'Invalid status'}, status=status.HTTP_400_BAD_REQUEST)
         
         previous_status = order.status
@@ -233,6 +374,64 @@ class OrderViewSet(viewsets.ModelViewSet):
 
         return Response(OrderSerializer(order).data)
 
+    @action(detail=False, methods=['post'], url_path='bulk_update_status')
+    def bulk_update_status(self, request):
+        new_status = request.data.get('status')
+        order_ids = request.data.get('order_ids')
+
+        if new_status not in _ORDER_STATUSES:
+            return Response({'error': 'Invalid status'}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not isinstance(order_ids, list) or not order_ids:
+            return Response({'error': 'order_ids must be a non-empty list'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            order_ids = [int(order_id) for order_id in order_ids]
+        except (TypeError, ValueError):
+            return Response({'error': 'order_ids must contain integers'}, status=status.HTTP_400_BAD_REQUEST)
+
+        updated_at = timezone.now()
+        with transaction.atomic():
+            # One fetch through get_queryset keeps the role filters and the
+            # select_related joins; one UPDATE and one bulk INSERT replace
+            # the per-order round-trips.
+            orders = list(self.get_queryset().filter(id__in=order_ids))
+            missing = set(order_ids) - {order.id for order in orders}
+            if missing:
+                # Match the single-order path, which 404s on ids outside
+                # the caller's queryset instead of silently skipping them.
+                return Response(
+                    {'error': 'Orders not found', 'order_ids': sorted(missing)},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            Order.objects.filter(id__in=order_ids).update(
+                status=new_status, updated_at=updated_at
+            )
+
+            for order in orders:
+                if order.status == 'pending' and new_status in OWNER_ACCEPTANCE_STATUSES:
+                    _credit_owner_for_order(order)
+
+            if new_status == 'ready_for_delivery':
+                Delivery.objects.bulk_create([
+                    Delivery(
+                        order=order,
+                        pickup_address=order.tiffin.owner.business_address,
+                        delivery_address=order.delivery_address,
+                        status='pending',
+                        delivery_boy=None,
+                    )
+                    for order in orders
+                ])
+
+            # Mirror the bulk UPDATE on the in-memory instances so the
+            # response reflects what was written.
+            for order in orders:
+                order.status = new_status
+                order.updated_at = updated_at
+
+        return Response(OrderSerializer(orders, many=True).data)
+
 class DeliveryFilter(filters.FilterSet):
     status = filters.CharFilter(field_name="status")
     pincode = filters.CharFilter(field_name="order__delivery_pincode")
@@ -250,18 +449,25 @@ class DeliveryViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
+        # DeliverySerializer embeds the full OrderSerializer and the fee
+        # transfer walks order.tiffin.owner.user, so join the whole chain
+        # up front instead of firing ~5 lazy queries per delivery.
+        queryset = Delivery.objects.select_related(
+            'order__customer', 'order__tiffin__owner__user',
+            'order__delivery_boy__user', 'delivery_boy__user'
+        )
         if user.user_type == 'delivery':
             # Delivery boys see deliveries in their pincode, either assigned or unassigned
             # For unassigned deliveries, check if the delivery_boy field is null and in their pincode
             # For assigned deliveries, ensure it's assigned to them
-            return Delivery.objects.filter(
+            return queryset.filter(
                 models.Q(delivery_boy__user=user) |
                 models.Q(delivery_boy__isnull=True, order__delivery_pincode=user.pincode)
             )
         elif user.user_type == 'owner':
-            return Delivery.objects.filter(order__tiffin__owner__user=user)
+            return queryset.filter(order__tiffin__owner__user=user)
         elif user.user_type == 'customer':
-            return Delivery.objects.filter(order__customer=user)
+            return queryset.filter(order__customer=user)
         return Delivery.objects.none()
 
     @action(detail=True, methods=['post'])
@@ -269,7 +475,7 @@ class DeliveryViewSet(viewsets.ModelViewSet):
         delivery = self.get_object()
         new_status = request.data.get('status')
         
-        if new_status not in dict(Delivery.STATUS_CHOICES):
+        if new_status not in _DELIVERY_STATUSES:
             return Response({'error': 'Invalid status'}, status=status.HTTP_400_BAD_REQUEST)
         
         delivery.status = new_status
@@ -295,14 +501,20 @@ class DeliveryViewSet(viewsets.ModelViewSet):
         except DeliveryBoy.DoesNotExist:
             return Response({'error': 'Delivery boy profile not found.'}, status=status.HTTP_404_NOT_FOUND)
 
-        try:
-            with transaction.atomic():
-                delivery.delivery_boy = delivery_boy_profile
-                delivery.status = 'accepted'
-                delivery.save()
-                _transfer_delivery_fee(delivery)
-        except ValidationError as exc:
-            return Response(exc.detail, status=status.HTTP_400_BAD_REQUEST)
+        # Cheap synchronous pre-check so an underfunded owner still gets a
+        # 400 here; the transfer itself re-validates under lock.
+        owner_wallet = _get_wallet(delivery.order.tiffin.owner.user)
+        if owner_wallet.balance < DELIVERY_FEE:
+            return Response(
+                {'wallet': 'Owner wallet has insufficient balance to pay delivery fee.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        with transaction.atomic():
+            delivery.delivery_boy = delivery_boy_profile
+            delivery.status = 'accepted'
+            delivery.save()
+            transaction.on_commit(lambda: _run_delivery_fee_transfer(delivery.id))
 
         return Response(DeliverySerializer(delivery).data)
 
@@ -311,8 +523,7 @@ class WalletViewSet(viewsets.ViewSet):
     permission_classes = [permissions.IsAuthenticated]
 
     def _get_or_create_wallet(self, user):
-        wallet, _ = Wallet.objects.get_or_create(user=user)
-        return wallet
+        return _get_wallet(user)
 
     def list(self, request):
         wallet = self._get_or_create_wallet(request.user)
@@ -326,66 +537,63 @@ class WalletViewSet(viewsets.ViewSet):
 
     @action(detail=False, methods=['post'])
     def deposit(self, request):
-        amount = request.data.get('amount')
+        amount = _parse_amount(request.data.get('amount'))
         reference = request.data.get('reference', '')
-        try:
-            amount = float(amount)
-        except (TypeError, ValueError):
+        if amount is None:
             return Response({'error': 'Invalid amount'}, status=status.HTTP_400_BAD_REQUEST)
         if amount <= 0:
             return Response({'error': 'Amount must be positive'}, status=status.HTTP_400_BAD_REQUEST)
         wallet = self._get_or_create_wallet(request.user)
-        # Update balance and record transaction
-        wallet.balance = (wallet.balance or 0) + amount
-        wallet.save()
-        WalletTransaction.objects.create(wallet=wallet, txn_type='credit', amount=amount, reference='Added to Wallet')
+        # Atomic F() update and the transaction record commit together.
+        with transaction.atomic():
+            _adjust_wallet_balance(wallet, amount)
+            _record_wallet_transaction(wallet, 'credit', amount, reference='Added to Wallet')
         return Response(WalletSerializer(wallet).data)
 
     @action(detail=False, methods=['post'])
     def add_to_wallet_from_bank(self, request):
-        amount = request.data.get('amount')
+        amount = _parse_amount(request.data.get('amount'))
         reference = request.data.get('reference', '')
-        try:
-            amount = float(amount)
-        except (TypeError, ValueError):
+        if amount is None:
             return Response({'error': 'Invalid amount'}, status=status.HTTP_400_BAD_REQUEST)
         if amount <= 0:
             return Response({'error': 'Amount must be positive'}, status=status.HTTP_400_BAD_REQUEST)
         wallet = self._get_or_create_wallet(request.user)
-        # Update balance and record transaction
-        wallet.balance = (wallet.balance or 0) + amount
-        wallet.save()
-        WalletTransaction.objects.create(wallet=wallet, txn_type='added from bank account', amount=amount, reference='Added from Bank Account')
+        # Atomic F() update and the transaction record commit together.
+        with transaction.atomic():
+            _adjust_wallet_balance(wallet, amount)
+            _record_wallet_transaction(
+                wallet, 'added from bank account', amount, reference='Added from Bank Account'
+            )
         return Response(WalletSerializer(wallet).data)
 
     @action(detail=False, methods=['post'])
     @csrf_exempt
     def credit(self, request):
-        amount = request.data.get('amount')
+        amount = _parse_amount(request.data.get('amount'))
         bank_account_id = request.data.get('bank_account_id')
-        try:
-            amount = float(amount)
-        except (TypeError, ValueError):
+        if amount is None:
             return Response({'error': 'Invalid amount'}, status=status.HTTP_400_BAD_REQUEST)
         if amount <= 0:
             return Response({'error': 'Amount must be positive'}, status=status.HTTP_400_BAD_REQUEST)
-        wallet = self._get_or_create_wallet(request.user)
-        if wallet.balance < amount:
-            return Response({'error': 'Insufficient balance'}, status=status.HTTP_400_BAD_REQUEST)
-        # Validate bank account ownership
-        try:
-            if bank_account_id:
-                bank = BankAccount.objects.get(id=bank_account_id, user=request.user)
-            else:
-                bank = BankAccount.objects.filter(user=request.user, is_primary=True).first()
-        except BankAccount.DoesNotExist:
-            bank = None
+        # Validate bank account ownership; .first() returns None on a bad id
+        # without the exception machinery of .get().
+        if bank_account_id:
+            bank = BankAccount.objects.filter(id=bank_account_id, user=request.user).first()
+        else:
+            bank = BankAccount.objects.filter(user=request.user, is_primary=True).first()
         if not bank:
             return Response({'error': 'No valid bank account found'}, status=status.HTTP_400_BAD_REQUEST)
-        # Deduct and record
-        wallet.balance = wallet.balance - amount
-        wallet.save()
-        WalletTransaction.objects.create(wallet=wallet, txn_type='withdraw to bank account', amount=amount, reference=f"Withdrawn to Bank: {bank.id}")
+        # Lock the wallet so the balance check and the debit see the same
+        # value; two concurrent withdrawals can no longer both pass.
+        with transaction.atomic():
+            wallet = _get_wallet_for_update(request.user)
+            if wallet.balance < amount:
+                return Response({'error': 'Insufficient balance'}, status=status.HTTP_400_BAD_REQUEST)
+            _adjust_wallet_balance(wallet, -amount)
+            _record_wallet_transaction(
+                wallet, 'withdraw to bank account', amount, reference=f"Withdrawn to Bank: {bank.id}"
+            )
         return Response(WalletSerializer(wallet).data)
 
     @action(detail=False, methods=['post'])
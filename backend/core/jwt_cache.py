@@ -0,0 +1,58 @@
+"""Short-TTL cache for validated JWTs.
+
+Signature verification runs on every authenticated request, and a busy
+client re-presents the same access token for its whole lifetime. Cache
+validated tokens keyed by a SHA-256 of the raw token so repeat requests
+cost a hash plus a dict lookup instead of the full crypto verification.
+Entries expire at the token's own ``exp`` or after ``CACHE_TTL`` seconds,
+whichever comes first, and the cache is LRU-bounded.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+CACHE_TTL = 30
+CACHE_MAX_SIZE = 10000
+
+_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def clear_cache():
+    with _lock:
+        _cache.clear()
+
+
+class CachingJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that reuses recently validated tokens."""
+
+    def get_validated_token(self, raw_token):
+        key = hashlib.sha256(raw_token).digest()
+        now = time.time()
+
+        with _lock:
+            entry = _cache.get(key)
+            if entry is not None:
+                validated, expires_at = entry
+                if expires_at > now:
+                    _cache.move_to_end(key)
+                    return validated
+                del _cache[key]
+
+        validated = super().get_validated_token(raw_token)
+
+        expires_at = now + CACHE_TTL
+        exp = validated.payload.get('exp')
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+
+        with _lock:
+            _cache[key] = (validated, expires_at)
+            _cache.move_to_end(key)
+            while len(_cache) > CACHE_MAX_SIZE:
+                _cache.popitem(last=False)
+
+        return validated
@@ -34,6 +34,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -101,6 +102,17 @@ USE_TZ = True
 STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
+# WhiteNoise serves hashed, pre-compressed static files from the app
+# process, so Django's URL resolver never sees static requests.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
@@ -113,7 +125,8 @@ AUTH_USER_MODEL = 'users.User'
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # Caching wrapper around SimpleJWT's JWTAuthentication; see core/jwt_cache.py
+        'core.jwt_cache.CachingJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -123,11 +136,27 @@ REST_FRAMEWORK = {
 }
 
 # JWT settings
+#
+# When JWT_SIGNING_KEY/JWT_VERIFYING_KEY are set (a PEM-encoded Ed25519
+# key pair; requires the `cryptography` package), tokens use EdDSA —
+# signature verification runs on every authenticated request and Ed25519
+# verifies several times faster than RSA. Without the keys the config
+# falls back to SimpleJWT's HS256 + SECRET_KEY default.
+_JWT_SIGNING_KEY = os.getenv('JWT_SIGNING_KEY')
+_JWT_VERIFYING_KEY = os.getenv('JWT_VERIFYING_KEY')
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(days=1),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
 }
 
+if _JWT_SIGNING_KEY and _JWT_VERIFYING_KEY:
+    SIMPLE_JWT.update({
+        'ALGORITHM': 'EdDSA',
+        'SIGNING_KEY': _JWT_SIGNING_KEY,
+        'VERIFYING_KEY': _JWT_VERIFYING_KEY,
+    })
+
 # CORS settings
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
@@ -1,8 +1,11 @@
+import os
+import re
+
 from django.contrib import admin
-from django.urls import path, include, re_path
+from django.http import Http404, HttpResponse
+from django.urls import path, re_path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from django.views.generic import TemplateView
 from rest_framework.routers import DefaultRouter
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from api.views import (
@@ -25,6 +28,37 @@ router.register(r'deliveries', DeliveryViewSet)
 router.register(r'wallet', WalletViewSet, basename='wallet')
 router.register(r'bank-accounts', BankAccountViewSet, basename='bank-accounts')
 
+# Evaluate the router's url patterns once at import time; DefaultRouter
+# rebuilds them lazily through a cached property otherwise.
+_ROUTER_URLS = list(router.urls)
+
+# O(1) reverse map for router-generated URL names: Django's reverse()
+# scans the candidate patterns for a name on every call, while this walks
+# the router exactly once at import time. Named regex groups become
+# str.format placeholders; the duplicate format-suffix patterns the
+# router appends are skipped so each name keeps its plain form.
+_NAMED_GROUP_RE = re.compile(r'\(\?P<(\w+)>[^)]+\)')
+
+NAME_TO_PATTERN = {}
+for _url in _ROUTER_URLS:
+    if _url.name and _url.name not in NAME_TO_PATTERN:
+        _regex = _url.pattern.regex.pattern.lstrip('^').rstrip('$')
+        NAME_TO_PATTERN[_url.name] = '/api/' + _NAMED_GROUP_RE.sub(r'{\1}', _regex)
+
+
+def fast_reverse(name, **kwargs):
+    """Build a router URL by name with a dict lookup plus str.format."""
+    return NAME_TO_PATTERN[name].format(**kwargs)
+
+
+# Hard-coded path constants for hot endpoints, so callers (and the test
+# suite) can build URLs without a reverse() scan over the pattern list.
+TOKEN_OBTAIN_PATH = '/api/token/'
+TOKEN_REFRESH_PATH = '/api/token/refresh/'
+WALLET_PATH = fast_reverse('wallet-list')
+WALLET_DEPOSIT_PATH = fast_reverse('wallet-deposit')
+WALLET_TRANSACTIONS_PATH = fast_reverse('wallet-transactions')
+
 # Swagger documentation setup
 schema_view = get_schema_view(
     openapi.Info(
@@ -41,19 +75,41 @@ schema_view = get_schema_view(
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('api/', include(router.urls)),
+    path('api/', include(_ROUTER_URLS)),
     path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     
-    # Swagger documentation URLs
-    path('api/docs/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('api/redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
+    # Swagger documentation URLs. cache_timeout=0 regenerated the schema
+    # (a walk of every viewset and serializer) on each hit; cache it for
+    # ten minutes instead.
+    path('api/docs/', schema_view.with_ui('swagger', cache_timeout=600), name='schema-swagger-ui'),
+    path('api/redoc/', schema_view.with_ui('redoc', cache_timeout=600), name='schema-redoc'),
 ]
 
-# Serve media files in development
+# The dev catch-all serves the SPA shell as cached bytes instead of
+# running the template engine per route. A stat per request keeps the
+# cache honest while the shell is being edited: the file is re-read only
+# when its mtime changes, so a dev-server restart is never needed.
+_INDEX_PATH = os.path.join(settings.BASE_DIR, 'templates', 'index.html')
+_index_cache = (None, b'')  # (mtime, bytes)
+
+
+def _serve_index(request):
+    global _index_cache
+    try:
+        mtime = os.stat(_INDEX_PATH).st_mtime
+    except OSError:
+        raise Http404('index.html not found')
+    cached_mtime, body = _index_cache
+    if mtime != cached_mtime:
+        with open(_INDEX_PATH, 'rb') as f:
+            body = f.read()
+        _index_cache = (mtime, body)
+    return HttpResponse(body, content_type='text/html')
+
+
+# Serve media files and the SPA shell in development; static files go
+# through WhiteNoise in every environment.
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
-    # Serve static files in development
-    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
-    # Catch all other URLs and serve the frontend
-    urlpatterns += [re_path(r'^.*$', TemplateView.as_view(template_name='index.html'))] 
\ No newline at end of file
+    urlpatterns += [re_path(r'^.*$', _serve_index)]
\ No newline at end of file
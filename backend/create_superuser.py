@@ -13,14 +13,16 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 django.setup()
 
+from django.db.models import Q
+
 from users.models import User
 
-# Check existing users
+# Check existing users (values_list avoids materializing full model instances)
 print("Existing users in database:")
-users = User.objects.all()
-if users.exists():
-    for u in users:
-        print(f"  - ID: {u.id}, Username: {u.username}, Phone: {u.phone_number}, Type: {u.user_type}, Is Superuser: {u.is_superuser}")
+users = list(User.objects.values_list('id', 'username', 'phone_number', 'user_type', 'is_superuser'))
+if users:
+    for user_id, existing_username, phone, utype, is_superuser in users:
+        print(f"  - ID: {user_id}, Username: {existing_username}, Phone: {phone}, Type: {utype}, Is Superuser: {is_superuser}")
 else:
     print("  No users found.")
 
@@ -37,14 +39,27 @@ address = "123 Main St"
 pincode = "123456"
 password = "admin123"  # Change this!
 
-# Check if user with this phone_number and user_type already exists
-if User.objects.filter(phone_number=phone_number, user_type=user_type).exists():
+# One combined query covers both uniqueness checks; decide which
+# conflict (if any) occurred in Python. order_by() drops the model's
+# default ordering — row order is irrelevant for an existence probe.
+conflicts = User.objects.filter(
+    Q(username=username) | Q(phone_number=phone_number, user_type=user_type)
+).order_by().values_list('username', 'phone_number', 'user_type')
+
+phone_taken = False
+username_taken = False
+for existing_username, existing_phone, existing_type in conflicts:
+    if existing_phone == phone_number and existing_type == user_type:
+        phone_taken = True
+    if existing_username == username:
+        username_taken = True
+
+if phone_taken:
     print(f"\nERROR: A user with phone_number '{phone_number}' and user_type '{user_type}' already exists!")
     print("Please use a different phone number or user type.")
     sys.exit(1)
 
-# Check if username already exists
-if User.objects.filter(username=username).exists():
+if username_taken:
     print(f"\nERROR: Username '{username}' already exists!")
     print("Please use a different username.")
     sys.exit(1)
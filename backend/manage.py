@@ -6,7 +6,13 @@ import sys
 
 def main():
     """Run administrative tasks."""
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+    # The test settings build an in-memory SQLite database straight from
+    # the models (migrations disabled), so `manage.py test` skips the full
+    # migration replay unless a settings module is given explicitly.
+    default_settings = 'core.settings'
+    if len(sys.argv) > 1 and sys.argv[1] == 'test':
+        default_settings = 'tests.settings_test'
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', default_settings)
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
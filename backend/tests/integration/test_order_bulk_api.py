@@ -0,0 +1,109 @@
+"""
+Simple integration test for the bulk order status API endpoint.
+Tests bulk status updates and owner wallet crediting through HTTP.
+"""
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.test import TestCase
+
+from api.models import Tiffin, Order
+from core.urls import fast_reverse
+from users.models import TiffinOwner, Wallet
+
+User = get_user_model()
+
+BULK_UPDATE_PATH = fast_reverse('order-bulk-update-status')
+
+
+class OrderBulkUpdateAPITest(TestCase):
+    """Simple integration test for the bulk_update_status action."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create an owner with two pending orders once for the class."""
+        cls.owner_user = User.objects.create_user(
+            username='bulkowner',
+            email='owner@example.com',
+            password='testpass123',
+            user_type='owner',
+            phone_number='2234567890',
+            address='1 Owner Street',
+            pincode='123456'
+        )
+        cls.owner = TiffinOwner.objects.create(
+            user=cls.owner_user,
+            business_name='Bulk Tiffins',
+            business_address='1 Owner Street',
+            business_pincode='123456'
+        )
+        cls.customer = User.objects.create_user(
+            username='bulkcustomer',
+            email='customer@example.com',
+            password='testpass123',
+            user_type='customer',
+            phone_number='3234567890',
+            address='2 Customer Street',
+            pincode='123456'
+        )
+        cls.tiffin = Tiffin.objects.create(
+            owner=cls.owner,
+            name='Veg Thali',
+            description='A thali',
+            price=Decimal('50.00')
+        )
+        cls.orders = [
+            Order.objects.create(
+                customer=cls.customer,
+                tiffin=cls.tiffin,
+                quantity=1,
+                delivery_address='2 Customer Street',
+                delivery_pincode='123456'
+            )
+            for _ in range(2)
+        ]
+        cls.token = str(RefreshToken.for_user(cls.owner_user).access_token)
+
+    def setUp(self):
+        """Attach a fresh client carrying the owner's token."""
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+    def test_bulk_confirm_updates_orders_and_credits_owner(self):
+        """Confirming pending orders updates them and credits the owner."""
+        response = self.client.post(BULK_UPDATE_PATH, {
+            'status': 'confirmed',
+            'order_ids': [order.id for order in self.orders]
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual({row['status'] for row in response.data}, {'confirmed'})
+        for order in self.orders:
+            order.refresh_from_db()
+            self.assertEqual(order.status, 'confirmed')
+
+        wallet = Wallet.objects.get(user=self.owner_user)
+        self.assertEqual(wallet.balance, Decimal('100.00'))
+
+    def test_bulk_update_rejects_unknown_order_ids(self):
+        """Ids outside the caller's orders return 404, not a partial update."""
+        response = self.client.post(BULK_UPDATE_PATH, {
+            'status': 'confirmed',
+            'order_ids': [self.orders[0].id, 999999]
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIn(999999, response.data['order_ids'])
+        self.orders[0].refresh_from_db()
+        self.assertEqual(self.orders[0].status, 'pending')
+
+    def test_bulk_update_rejects_non_numeric_order_ids(self):
+        """Non-numeric ids return 400 instead of a server error."""
+        response = self.client.post(BULK_UPDATE_PATH, {
+            'status': 'confirmed',
+            'order_ids': ['abc']
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -6,18 +6,26 @@ from decimal import Decimal
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
 from django.test import TestCase
 
+from core.urls import WALLET_DEPOSIT_PATH, WALLET_PATH
+
 User = get_user_model()
 
 
 class WalletAPITest(TestCase):
     """Simple integration test for wallet deposit API."""
     
-    def setUp(self):
-        """Set up test client and user."""
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Create the user and mint a token once for the whole class.
+
+        Password hashing and token signing are the expensive parts of this
+        setup; per-test state is rolled back by the wrapping transaction,
+        so doing them per test method just repeats the same work.
+        """
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123',
@@ -26,30 +34,30 @@ class WalletAPITest(TestCase):
             address='123 Test Street',
             pincode='123456'
         )
-        # Get JWT token using username (SimpleJWT uses USERNAME_FIELD=“username” here)
-        response = self.client.post('/api/token/', {
-            'username': 'testuser',
-            'password': 'testpass123'
-        })
-        self.token = response.data.get('access')
-        assert self.token, "Token generation failed in test setup"
+        # Mint the JWT directly; the token endpoint would only add a full
+        # request/response cycle plus a password check on top of this.
+        cls.token = str(RefreshToken.for_user(cls.user).access_token)
+
+    def setUp(self):
+        """Attach a fresh client carrying the shared token."""
+        self.client = APIClient()
         self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
     
     def test_deposit_money_to_wallet(self):
         """Test depositing money via API endpoint."""
         # Get initial balance
-        response = self.client.get('/api/wallet/')
+        response = self.client.get(WALLET_PATH)
         initial_balance = Decimal(str(response.data['balance']))
         
         # Deposit money
-        deposit_response = self.client.post('/api/wallet/deposit/', {
+        deposit_response = self.client.post(WALLET_DEPOSIT_PATH, {
             'amount': 100
         })
         
         self.assertEqual(deposit_response.status_code, status.HTTP_200_OK)
         
         # Check new balance
-        response = self.client.get('/api/wallet/')
+        response = self.client.get(WALLET_PATH)
         new_balance = Decimal(str(response.data['balance']))
         
         self.assertEqual(new_balance, initial_balance + Decimal('100.00'))
@@ -58,7 +66,7 @@ class WalletAPITest(TestCase):
         """Test that deposit requires authentication."""
         self.client.credentials()  # Remove authentication
         
-        response = self.client.post('/api/wallet/deposit/', {
+        response = self.client.post(WALLET_DEPOSIT_PATH, {
             'amount': 100
         })
         
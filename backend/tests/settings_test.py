@@ -22,3 +22,7 @@ class DisableMigrations:
 
 MIGRATION_MODULES = DisableMigrations()
 
+# Password hashing is pure CPU burn in tests; MD5 instead of PBKDF2's
+# hundreds of thousands of iterations per create_user/login.
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
@@ -8,79 +8,36 @@ from api.serializers import UserSerializer
 
 class PasswordValidationTest(TestCase):
     """Simple specification test for password validation rules."""
-    
-    def test_password_must_have_uppercase_letter(self):
-        """Test that password must contain at least one uppercase letter."""
-        serializer = UserSerializer(data={
-            'username': 'testuser',
-            'email': 'test@example.com',
-            'password': 'lowercase123!',
-            'confirm_password': 'lowercase123!',
-            'user_type': 'customer',
-            'phone_number': '1234567890',
-            'pincode': '123456'
-        })
-        
-        self.assertFalse(serializer.is_valid())
-        self.assertIn('password', serializer.errors)
-    
-    def test_password_must_have_number(self):
-        """Test that password must contain at least one number."""
-        serializer = UserSerializer(data={
-            'username': 'testuser',
-            'email': 'test@example.com',
-            'password': 'NoNumbers!',
-            'confirm_password': 'NoNumbers!',
-            'user_type': 'customer',
-            'phone_number': '1234567890',
-            'pincode': '123456'
-        })
-        
-        self.assertFalse(serializer.is_valid())
-        self.assertIn('password', serializer.errors)
-    
-    def test_password_must_have_special_character(self):
-        """Test that password must contain at least one special character."""
-        serializer = UserSerializer(data={
-            'username': 'testuser',
-            'email': 'test@example.com',
-            'password': 'NoSpecial123',
-            'confirm_password': 'NoSpecial123',
-            'user_type': 'customer',
-            'phone_number': '1234567890',
-            'pincode': '123456'
-        })
-        
-        self.assertFalse(serializer.is_valid())
-        self.assertIn('password', serializer.errors)
-    
-    def test_password_must_be_at_least_8_characters(self):
-        """Test that password must be at least 8 characters long."""
-        serializer = UserSerializer(data={
-            'username': 'testuser',
-            'email': 'test@example.com',
-            'password': 'Short1!',
-            'confirm_password': 'Short1!',
-            'user_type': 'customer',
-            'phone_number': '1234567890',
-            'pincode': '123456'
-        })
-        
-        self.assertFalse(serializer.is_valid())
-        self.assertIn('password', serializer.errors)
-    
-    def test_valid_password_passes_validation(self):
-        """Test that a valid password passes all validation rules."""
-        serializer = UserSerializer(data={
+
+    # (case label, password, should validate)
+    PASSWORD_CASES = [
+        ('missing uppercase letter', 'lowercase123!', False),
+        ('missing number', 'NoNumbers!', False),
+        ('missing special character', 'NoSpecial123', False),
+        ('shorter than 8 characters', 'Short1!', False),
+        ('satisfies all rules', 'ValidPass123!', True),
+    ]
+
+    @staticmethod
+    def _serializer_for(password):
+        return UserSerializer(data={
             'username': 'testuser',
             'email': 'test@example.com',
-            'password': 'ValidPass123!',
-            'confirm_password': 'ValidPass123!',
+            'password': password,
+            'confirm_password': password,
             'user_type': 'customer',
             'phone_number': '1234567890',
             'address': '123 Test Street',
             'pincode': '123456'
         })
-        
-        self.assertTrue(serializer.is_valid())
 
+    def test_password_rules(self):
+        """Test every password policy rule from one table of cases."""
+        for label, password, should_validate in self.PASSWORD_CASES:
+            with self.subTest(case=label, password=password):
+                serializer = self._serializer_for(password)
+                if should_validate:
+                    self.assertTrue(serializer.is_valid(), serializer.errors)
+                else:
+                    self.assertFalse(serializer.is_valid())
+                    self.assertIn('password', serializer.errors)
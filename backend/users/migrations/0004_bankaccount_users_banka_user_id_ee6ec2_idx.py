@@ -0,0 +1,17 @@
+# Generated by Django 5.0.2 on 2026-08-31 10:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_delete_otpcode_alter_wallettransaction_txn_type'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bankaccount',
+            index=models.Index(fields=['user', 'is_primary'], name='users_banka_user_id_ee6ec2_idx'),
+        ),
+    ]
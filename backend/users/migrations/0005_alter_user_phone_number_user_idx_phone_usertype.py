@@ -0,0 +1,23 @@
+# Generated by Django 5.0.2 on 2026-08-31 10:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0004_bankaccount_users_banka_user_id_ee6ec2_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='phone_number',
+            field=models.CharField(db_index=True, max_length=15),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['phone_number', 'user_type'], name='idx_phone_usertype'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.2 on 2026-08-31 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_alter_user_phone_number_user_idx_phone_usertype'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='deliveryboy',
+            name='vehicle_number',
+            field=models.CharField(db_index=True, max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='pincode',
+            field=models.CharField(db_index=True, max_length=6),
+        ),
+    ]
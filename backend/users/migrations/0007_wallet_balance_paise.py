@@ -0,0 +1,35 @@
+from django.db import migrations, models
+from django.db.models import BigIntegerField, F
+from django.db.models.functions import Cast
+
+
+def copy_balance_to_paise(apps, schema_editor):
+    Wallet = apps.get_model('users', 'Wallet')
+    Wallet.objects.update(balance_paise=Cast(F('balance') * 100, BigIntegerField()))
+
+
+def copy_paise_to_balance(apps, schema_editor):
+    Wallet = apps.get_model('users', 'Wallet')
+    Wallet.objects.update(
+        balance=Cast(F('balance_paise'), models.DecimalField(max_digits=12, decimal_places=2)) / 100
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_alter_deliveryboy_vehicle_number_alter_user_pincode'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='wallet',
+            name='balance_paise',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.RunPython(copy_balance_to_paise, copy_paise_to_balance),
+        migrations.RemoveField(
+            model_name='wallet',
+            name='balance',
+        ),
+    ]
@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 
@@ -9,9 +11,12 @@ class User(AbstractUser):
     )
     
     user_type = models.CharField(max_length=10, choices=USER_TYPE_CHOICES)
-    phone_number = models.CharField(max_length=15)
+    phone_number = models.CharField(max_length=15, db_index=True)
     address = models.TextField()
-    pincode = models.CharField(max_length=6)
+    # Kept as a fixed-width CharField (pincodes can be zero-padded and are
+    # compared against Order.delivery_pincode); indexed for the delivery
+    # feed lookups.
+    pincode = models.CharField(max_length=6, db_index=True)
     
     # Required fields for createsuperuser command
     REQUIRED_FIELDS = ['email', 'phone_number', 'user_type', 'address', 'pincode']
@@ -23,6 +28,12 @@ class User(AbstractUser):
         constraints = [
             models.UniqueConstraint(fields=['phone_number', 'user_type'], name='uniq_phone_per_user_type')
         ]
+        indexes = [
+            # Explicit index for the (phone_number, user_type) existence
+            # probes in signup and create_superuser, declared independently
+            # of the unique constraint above.
+            models.Index(fields=['phone_number', 'user_type'], name='idx_phone_usertype'),
+        ]
 
 class TiffinOwner(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='tiffin_owner')
@@ -37,7 +48,7 @@ class TiffinOwner(models.Model):
 
 class DeliveryBoy(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='delivery_boy')
-    vehicle_number = models.CharField(max_length=20)
+    vehicle_number = models.CharField(max_length=20, db_index=True)
     is_available = models.BooleanField(default=True)
     current_location = models.CharField(max_length=100, blank=True)
     
@@ -54,15 +65,32 @@ class BankAccount(models.Model):
     is_primary = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'is_primary']),
+        ]
+
     def __str__(self):
         return f"{self.bank_name} - ****{self.account_number[-4:]} ({self.user.username})"
 
 
 class Wallet(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='wallet')
-    balance = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    # Stored as integer paise: balance updates become plain integer
+    # arithmetic in the database instead of NUMERIC math, and the column
+    # packs tighter. The `balance` property keeps the Decimal-rupee
+    # interface for all callers.
+    balance_paise = models.BigIntegerField(default=0)
     updated_at = models.DateTimeField(auto_now=True)
 
+    @property
+    def balance(self):
+        return Decimal(self.balance_paise) / Decimal(100)
+
+    @balance.setter
+    def balance(self, value):
+        self.balance_paise = int((Decimal(value) * 100).to_integral_value())
+
     def __str__(self):
         return f"Wallet({self.user.username}) - {self.balance}"
 